@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 # stdlib
-from collections import OrderedDict
+from collections import defaultdict
 from collections.abc import Callable
+from dataclasses import dataclass
+import functools
 import inspect
 from inspect import Parameter
 from inspect import signature
+import operator
 import types
 from typing import Any
 from typing import TYPE_CHECKING
+from typing import Union
 from typing import cast
 from typing import get_args
 from typing import get_origin
@@ -25,6 +29,7 @@ from ..abstract_server import AbstractServer
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
 from ..protocol.data_protocol import migrate_args_and_kwargs
+from ..protocol.data_protocol import migrate_result
 from ..serde.deserialize import _deserialize
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
@@ -80,7 +85,7 @@ IPYNB_BACKGROUND_METHODS = {
     "__kwdefaults__",
 }
 
-IPYNB_BACKGROUND_PREFIXES = ["_ipy", "_repr", "__ipython", "__pydantic"]
+IPYNB_BACKGROUND_PREFIXES = ("_ipy", "_repr", "__ipython", "__pydantic")
 
 
 @exclude_from_traceback
@@ -108,23 +113,98 @@ def _has_config_dict(t: Any) -> bool:
 
 _config_dict = ConfigDict(arbitrary_types_allowed=True)
 
+# building a TypeAdapter compiles a validator for the annotation, which costs far
+# more than running it, so keep one per annotation across calls
+_type_adapter_cache: dict[Any, TypeAdapter] = {}
 
-def _check_type(v: object, t: Any) -> Any:
+
+def _get_type_adapter(t: Any) -> TypeAdapter:
+    try:
+        return _type_adapter_cache[t]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable annotation, can't be cached
+        return _build_type_adapter(t)
+
+    type_adapter = _build_type_adapter(t)
+    _type_adapter_cache[t] = type_adapter
+    return type_adapter
+
+
+def _build_type_adapter(t: Any) -> TypeAdapter:
     # TypeAdapter only accepts `config` arg if `t` does not
     # already contain a ConfigDict
     # i.e model_config in BaseModel and __pydantic_config__ in
     # other types.
-    type_adapter = (
+    return (
         TypeAdapter(t, config=_config_dict)
         if not _has_config_dict(t)
         else TypeAdapter(t)
     )
 
-    return type_adapter.validate_python(v)
+
+# annotations that are plain classes, or unions of them, are checked with a
+# single isinstance call; values that fail it still go through pydantic, which
+# may accept them by coercion (e.g. an int for a float)
+_isinstance_types_cache: dict[Any, type | tuple[type, ...] | None] = {}
+
+
+def _get_isinstance_types(t: Any) -> type | tuple[type, ...] | None:
+    try:
+        return _isinstance_types_cache[t]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable annotation, can't be cached
+        return None
+
+    isinstance_types = _build_isinstance_types(t)
+    _isinstance_types_cache[t] = isinstance_types
+    return isinstance_types
+
+
+def _build_isinstance_types(t: Any) -> type | tuple[type, ...] | None:
+    if t is Any:
+        return object
+
+    origin = get_origin(t)
+    if origin is Union or origin is types.UnionType:
+        candidates = get_args(t)
+    else:
+        candidates = (t,)
+
+    if not all(isinstance(c, type) and get_origin(c) is None for c in candidates):
+        return None
+    try:
+        # TypedDicts and non runtime checkable Protocols reject isinstance
+        isinstance(None, candidates)
+    except TypeError:
+        return None
+    return candidates[0] if len(candidates) == 1 else candidates
+
+
+def _type_matches(v: object, t: Any) -> bool:
+    isinstance_types = _get_isinstance_types(t)
+    if isinstance_types is not None and isinstance(v, isinstance_types):
+        return True
+    # only values failing the isinstance check pay for raising ValidationError
+    try:
+        _get_type_adapter(t).validate_python(v)
+    except ValueError:
+        return False
+    return True
+
+
+def _registry_key(server_uid: UID, user_verify_key: SyftVerifyKey) -> tuple[int, bytes]:
+    # plain int / bytes keys hash and compare natively, unlike UID / SyftVerifyKey
+    return server_uid.value.int, bytes(user_verify_key.verify_key)
 
 
 class APIRegistry:
-    __api_registry__: dict[tuple, SyftAPI] = OrderedDict()
+    __api_registry__: dict[tuple[int, bytes], SyftAPI] = {}
+    # verify keys registered per server, in registration order
+    __api_registry_by_server__: dict[int, list[bytes]] = defaultdict(list)
 
     @classmethod
     def set_api_for(
@@ -139,15 +219,27 @@ class APIRegistry:
         if isinstance(user_verify_key, str):
             user_verify_key = SyftVerifyKey.from_string(user_verify_key)
 
-        key = (server_uid, user_verify_key)
+        key = _registry_key(server_uid, user_verify_key)
+
+        if key not in cls.__api_registry__:
+            server_key, verify_key = key
+            server_verify_keys = cls.__api_registry_by_server__[server_key]
+            if verify_key in server_verify_keys:
+                # stale entry, the registry was reset
+                server_verify_keys.remove(verify_key)
+            server_verify_keys.append(verify_key)
 
         cls.__api_registry__[key] = api
 
     @classmethod
     @as_result(SyftException)
     def api_for(cls, server_uid: UID, user_verify_key: SyftVerifyKey) -> SyftAPI:
-        key = (server_uid, user_verify_key)
-        api_instance = cls.__api_registry__.get(key, None)
+        # objects that were never sent to a server have no location / key
+        api_instance = (
+            cls.__api_registry__.get(_registry_key(server_uid, user_verify_key), None)
+            if server_uid is not None and user_verify_key is not None
+            else None
+        )
 
         if api_instance is None:
             msg = f"Unable to get the API. Please login to datasite {server_uid}"
@@ -160,9 +252,14 @@ class APIRegistry:
         return list(cls.__api_registry__.values())
 
     @classmethod
-    def get_by_recent_server_uid(cls, server_uid: UID) -> SyftAPI | None:
-        for key, api in reversed(cls.__api_registry__.items()):
-            if key[0] == server_uid:
+    def get_by_recent_server_uid(cls, server_uid: UID | None) -> SyftAPI | None:
+        if server_uid is None:
+            return None
+        server_key = server_uid.value.int
+        server_verify_keys = cls.__api_registry_by_server__.get(server_key, [])
+        for verify_key in reversed(server_verify_keys):
+            api = cls.__api_registry__.get((server_key, verify_key), None)
+            if api is not None:
                 return api
         return None
 
@@ -184,6 +281,11 @@ class APIEndpoint(SyftObject):
     warning: APIEndpointWarning | None = None
     unwrap_on_success: bool = True
 
+    @property
+    def display_signature(self) -> Signature:
+        """Signature without the server side only parameters"""
+        return _get_display_signature(self.signature, self.has_self)
+
 
 @serializable()
 class LibEndpoint(SyftBaseObject):
@@ -200,6 +302,36 @@ class LibEndpoint(SyftBaseObject):
     has_self: bool = False
     pre_kwargs: dict[str, Any] | None = None
 
+    @property
+    def display_signature(self) -> Signature:
+        """Signature without the server side only parameters"""
+        return _get_display_signature(self.signature, self.has_self)
+
+
+def _remove_server_side_parameters(signature: Signature, has_self: bool) -> Signature:
+    args_to_remove = ["context"]
+    if not has_self:
+        args_to_remove.append("self")
+    return signature_remove(signature, args_to_remove)
+
+
+# Signatures are kept alive in their cache entry, so their ids can't be reused
+_MAX_DISPLAY_SIGNATURES = 4096
+_display_signature_cache: dict[tuple[int, bool], tuple[Signature, Signature]] = {}
+
+
+def _get_display_signature(signature: Signature, has_self: bool) -> Signature:
+    key = (id(signature), has_self)
+    cached = _display_signature_cache.get(key)
+    if cached is not None and cached[0] is signature:
+        return cached[1]
+
+    display_signature = _remove_server_side_parameters(signature, has_self)
+    if len(_display_signature_cache) >= _MAX_DISPLAY_SIGNATURES:
+        _display_signature_cache.clear()
+    _display_signature_cache[key] = (signature, display_signature)
+    return display_signature
+
 
 @serializable(attrs=["signature", "credentials", "serialized_message"])
 class SignedSyftAPICall(SyftObject):
@@ -213,16 +345,14 @@ class SignedSyftAPICall(SyftObject):
 
     @property
     def message(self) -> SyftAPICall:
-        # from deserialize we might not have this attr because __init__ is skipped
-        if not hasattr(self, "cached_deseralized_message"):
-            self.cached_deseralized_message = None
+        # from deserialize we might not have this attr because __init__ is skipped,
+        # a single dict lookup covers both the missing and the unset case
+        message = self.__dict__.get("cached_deseralized_message")
+        if message is None:
+            message = _deserialize(blob=self.serialized_message, from_bytes=True)
+            self.cached_deseralized_message = message
 
-        if self.cached_deseralized_message is None:
-            self.cached_deseralized_message = _deserialize(
-                blob=self.serialized_message, from_bytes=True
-            )
-
-        return self.cached_deseralized_message
+        return message
 
     @property
     def is_valid(self) -> bool:
@@ -342,7 +472,9 @@ class RemoteFunction(SyftObject):
 
         _valid_kwargs["communication_protocol"] = self.communication_protocol
 
-        api_call = SyftAPICall(
+        # fields are already validated, skip pydantic validation on the hot path
+        api_call = SyftAPICall.model_construct(
+            id=UID(),
             server_uid=self.server_uid,
             path=path,
             args=list(_valid_args),
@@ -362,10 +494,7 @@ class RemoteFunction(SyftObject):
             if self.refresh_api_callback is not None:
                 self.refresh_api_callback()
 
-        result, _ = migrate_args_and_kwargs(
-            [result], kwargs={}, to_latest_protocol=True
-        )
-        result = result[0]
+        result = migrate_result(result, to_latest_protocol=True)
 
         return post_process_result(result, self.unwrap_on_success)
 
@@ -522,7 +651,8 @@ class RemoteUserCodeFunction(RemoteFunction):
     def jobs(self) -> list[Job]:
         if self.user_code_id is None:
             raise SyftException(public_message="Could not find user_code_id")
-        api_call = SyftAPICall(
+        api_call = SyftAPICall.model_construct(
+            id=UID(),
             server_uid=self.server_uid,
             path="job.get_by_user_code_id",
             args=[self.user_code_id],
@@ -549,6 +679,9 @@ def generate_remote_function(
             f"Signature {signature} can't have 'blocking' kwarg because it's reserved"
         )
 
+    # build the validator plan while the api is generated, not on the first call
+    _get_validator_plan(signature)
+
     # UserCodes are always code.call with a user_code_id
     if path == "code.call" and pre_kwargs is not None and "uid" in pre_kwargs:
         remote_function = RemoteUserCodeFunction(
@@ -596,10 +729,21 @@ def generate_remote_lib_function(
             f"Signature {signature} can't have 'blocking' kwarg because its reserved"
         )
 
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        # relative
-        from ..service.action.action_object import TraceResultRegistry
+    # build the validator plan while the api is generated, not on the first call
+    _get_validator_plan(signature)
 
+    # relative
+    # action_object imports this module, so these can't live at the top, but
+    # resolving them here once keeps them out of every call
+    from ..service.action.action_object import Action
+    from ..service.action.action_object import ActionType
+    from ..service.action.action_object import TraceResultRegistry
+    from ..service.action.action_object import convert_to_pointers
+
+    # e.g. numpy.array -> numpy, array
+    module, op = module_path.rsplit(".", 1)
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
         trace_result = TraceResultRegistry.get_trace_result_for_thread()
 
         if trace_result is not None:
@@ -621,23 +765,16 @@ def generate_remote_lib_function(
         if pre_kwargs:
             _valid_kwargs.update(pre_kwargs)
 
-        # relative
-        from ..service.action.action_object import Action
-        from ..service.action.action_object import ActionType
-        from ..service.action.action_object import convert_to_pointers
-
         action_args, action_kwargs = convert_to_pointers(
             api, wrapper_server_uid, _valid_args, _valid_kwargs
         )
 
-        # e.g. numpy.array -> numpy, array
-        module, op = module_path.rsplit(".", 1)
         action = Action(
             path=module,
             op=op,
             remote_self=None,
             args=[x.syft_lineage_id for x in action_args],
-            kwargs={k: v.syft_lineage_id for k, v in action_kwargs},
+            kwargs={k: v.syft_lineage_id for k, v in action_kwargs.items()},
             action_type=ActionType.FUNCTION,
             # TODO: fix
             result_id=LineageID(UID(), 1),
@@ -647,7 +784,8 @@ def generate_remote_lib_function(
         if trace_result is not None:
             trace_result.result += [action]
 
-        api_call = SyftAPICall(
+        api_call = SyftAPICall.model_construct(
+            id=UID(),
             server_uid=wrapper_server_uid,
             path=path,
             args=service_args,
@@ -692,7 +830,7 @@ class APIModule:
         return self._modules + ["path"]
 
     def has_submodule(self, name: str) -> bool:
-        """We use this as hasattr() triggers __getattribute__ which triggers recursion"""
+        """We use this as hasattr() would trigger an api refresh in __getattr__"""
         try:
             _ = object.__getattribute__(self, name)
             return True
@@ -706,35 +844,31 @@ class APIModule:
         self._modules.append(attr_name)
 
     def __getattr__(self, name: str) -> Any:
-        try:
-            return object.__getattribute__(self, name)
-        except AttributeError:
-            # if we fail, we refresh the api and try again
-            # however, we dont want this to happen all the time because of ipy magic happening
-            # in the background
-            if (
-                self.refresh_callback is not None
-                and name not in IPYNB_BACKGROUND_METHODS
-                and not any(
-                    name.startswith(prefix) for prefix in IPYNB_BACKGROUND_PREFIXES
-                )
-            ):
-                api = self.refresh_callback()
-                try:
-                    # get current path in the module tree
-                    new_current_module = api.services
-                    for submodule in self.path.split("."):
-                        if submodule != "":
-                            new_current_module = getattr(new_current_module, submodule)
-                    # retry getting the attribute, if this fails, we throw an error
-                    return object.__getattribute__(new_current_module, name)
-                except AttributeError:
-                    pass
-            raise AttributeError(
-                f"'APIModule' api{self.path} object has no submodule or method '{name}', "
-                "you may not have permission to access the module you are trying to access."
-                "If you think this is an error, try calling `client.refresh()` to update the API."
-            )
+        # only called when the regular attribute lookup fails.
+        # in that case we refresh the api and try again,
+        # however, we dont want this to happen all the time because of ipy magic happening
+        # in the background
+        if (
+            self.refresh_callback is not None
+            and name not in IPYNB_BACKGROUND_METHODS
+            and not name.startswith(IPYNB_BACKGROUND_PREFIXES)
+        ):
+            api = self.refresh_callback()
+            try:
+                # get current path in the module tree
+                new_current_module = api.services
+                for submodule in self.path.split("."):
+                    if submodule != "":
+                        new_current_module = getattr(new_current_module, submodule)
+                # retry getting the attribute, if this fails, we throw an error
+                return object.__getattribute__(new_current_module, name)
+            except AttributeError:
+                pass
+        raise AttributeError(
+            f"'APIModule' api{self.path} object has no submodule or method '{name}', "
+            "you may not have permission to access the module you are trying to access."
+            "If you think this is an error, try calling `client.refresh()` to update the API."
+        )
 
     def __getitem__(self, key: str | int) -> Any:
         if hasattr(self, "get_index"):
@@ -799,7 +933,31 @@ def debox_signed_syftapicall_response(
     return signed_result.message.data
 
 
+# Downgraded annotations and signatures only depend on their input and on the
+# object versions of the target protocol, so they are memoized per `object_versions`
+# dict. The dict is kept alive in the cache entry, so its id can't be reused.
+_MAX_DOWNGRADE_CACHE_PROTOCOLS = 8
+_downgrade_cache: dict[int, tuple[dict, dict[Any, Any], dict[int, tuple]]] = {}
+
+
+def _get_downgrade_cache(
+    object_versions: dict,
+) -> tuple[dict[Any, Any], dict[int, tuple[Signature, Signature]]]:
+    entry = _downgrade_cache.get(id(object_versions))
+    if entry is None:
+        if len(_downgrade_cache) >= _MAX_DOWNGRADE_CACHE_PROTOCOLS:
+            _downgrade_cache.clear()
+        entry = (object_versions, {}, {})
+        _downgrade_cache[id(object_versions)] = entry
+    return entry[1], entry[2]
+
+
 def downgrade_signature(signature: Signature, object_versions: dict) -> Signature:
+    _, signature_cache = _get_downgrade_cache(object_versions)
+    cached = signature_cache.get(id(signature))
+    if cached is not None and cached[0] is signature:
+        return cached[1]
+
     migrated_parameters = []
     for parameter in signature.parameters.values():
         annotation = unwrap_and_migrate_annotation(
@@ -825,10 +983,26 @@ def downgrade_signature(signature: Signature, object_versions: dict) -> Signatur
     except Exception as e:
         raise e
 
+    signature_cache[id(signature)] = (signature, new_signature)
     return new_signature
 
 
 def unwrap_and_migrate_annotation(annotation: Any, object_versions: dict) -> Any:
+    annotation_cache, _ = _get_downgrade_cache(object_versions)
+    try:
+        return annotation_cache[annotation]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable annotation, e.g. Annotated with unhashable metadata
+        return _unwrap_and_migrate_annotation(annotation, object_versions)
+
+    migrated_annotation = _unwrap_and_migrate_annotation(annotation, object_versions)
+    annotation_cache[annotation] = migrated_annotation
+    return migrated_annotation
+
+
+def _unwrap_and_migrate_annotation(annotation: Any, object_versions: dict) -> Any:
     args = get_args(annotation)
     origin = get_origin(annotation)
     if len(args) == 0:
@@ -848,21 +1022,38 @@ def unwrap_and_migrate_annotation(annotation: Any, object_versions: dict) -> Any
         else:
             return annotation
 
-    migrated_annotations = []
-    for arg in args:
-        migrated_annotation = unwrap_and_migrate_annotation(arg, object_versions)
-        migrated_annotations.append(migrated_annotation)
-
-    migrated_annotations_tuple = tuple(migrated_annotations)
+    # sub-annotations are memoized, so shared subtrees are only walked once
+    migrated_annotations_tuple = tuple(
+        unwrap_and_migrate_annotation(arg, object_versions) for arg in args
+    )
+    migrated_annotation = migrated_annotations_tuple[-1]
 
     if hasattr(annotation, "copy_with"):
         return annotation.copy_with(migrated_annotations_tuple)
+    elif origin is types.UnionType:
+        # `X | Y` unions can't be subscripted, rebuild them with `|`
+        return functools.reduce(operator.or_, migrated_annotations_tuple)
     elif origin is not None:
         return origin[migrated_annotations_tuple]
     else:
         return migrated_annotation[0]
 
 
+def _signature_needs_downgrade(
+    server_protocol: PROTOCOL_TYPE, communication_protocol: PROTOCOL_TYPE
+) -> bool:
+    """If server uses a higher protocol version than client, then
+    signatures needs to be downgraded."""
+    if str(server_protocol) == str(communication_protocol):
+        return False
+    if server_protocol == "dev":
+        # We assume dev is the highest staged protocol
+        return True
+    return communication_protocol != "dev" and int(server_protocol) > int(
+        communication_protocol
+    )
+
+
 def result_needs_api_update(api_call_result: Any) -> bool:
     # relative
     from ..service.request.request import Request
@@ -950,19 +1141,13 @@ class SyftAPI(SyftObject):
             server=server, role=role, credentials=user_verify_key
         )
 
-        # If server uses a higher protocol version than client, then
-        # signatures needs to be downgraded.
-        if server.current_protocol == "dev" and communication_protocol != "dev":
-            # We assume dev is the highest staged protocol
-            signature_needs_downgrade = True
-        else:
-            signature_needs_downgrade = server.current_protocol != "dev" and int(
-                server.current_protocol
-            ) > int(communication_protocol)
-        data_protocol = get_data_protocol()
+        signature_needs_downgrade = _signature_needs_downgrade(
+            server.current_protocol, communication_protocol
+        )
 
         if signature_needs_downgrade:
-            object_version_for_protocol = data_protocol.get_object_versions(
+            # downgraded signatures are cached per protocol, see downgrade_signature
+            object_version_for_protocol = get_data_protocol().get_object_versions(
                 communication_protocol
             )
 
@@ -1096,24 +1281,23 @@ class SyftAPI(SyftObject):
     ) -> None:
         """Recursively create a module path to the route endpoint."""
 
-        _modules = endpoint.module_path.split(".")[:-1] + [endpoint.name]
+        _modules = endpoint.module_path.split(".")[:-1]
 
         _self = api_module
-        _last_module = _modules.pop()
-        while _modules:
-            module = _modules.pop(0)
-            if not _self.has_submodule(module):
+        for module in _modules:
+            # submodules live in the instance __dict__, look them up directly
+            # instead of going through has_submodule + getattr
+            submodule = _self.__dict__.get(module)
+            if submodule is None:
                 submodule_path = (
                     f"{_self.path}.{module}" if _self.path != "" else module
                 )
-                _self._add_submodule(
-                    module,
-                    APIModule(
-                        path=submodule_path, refresh_callback=self.refresh_api_callback
-                    ),
+                submodule = APIModule(
+                    path=submodule_path, refresh_callback=self.refresh_api_callback
                 )
-            _self = getattr(_self, module)
-        _self._add_submodule(_last_module, endpoint_method)
+                _self._add_submodule(module, submodule)
+            _self = submodule
+        _self._add_submodule(endpoint.name, endpoint_method)
 
     def generate_endpoints(self) -> None:
         def build_endpoint_tree(
@@ -1122,11 +1306,7 @@ class SyftAPI(SyftObject):
         ) -> APIModule:
             api_module = APIModule(path="", refresh_callback=self.refresh_api_callback)
             for v in endpoints.values():
-                signature = v.signature
-                args_to_remove = ["context"]
-                if not v.has_self:
-                    args_to_remove.append("self")
-                signature = signature_remove(signature, args_to_remove)
+                signature = v.display_signature
                 if isinstance(v, APIEndpoint):
                     endpoint_function = generate_remote_function(
                         self,
@@ -1171,7 +1351,8 @@ class SyftAPI(SyftObject):
 
     @property
     def lib(self) -> APIModule:
-        if self.libs is None:
+        # without lib endpoints there is no lib tree, rebuilding wouldn't create one
+        if self.libs is None and self.lib_endpoints is not None:
             self.generate_endpoints()
         return cast(APIModule, self.libs)
 
@@ -1183,20 +1364,20 @@ class SyftAPI(SyftObject):
 
     def __repr__(self) -> str:
         modules = self.services
-        _repr_str = "client.api.services\n"
+        _repr_parts = ["client.api.services\n"]
         if modules is not None:
             for attr_name in modules._modules:
                 module_or_func = getattr(modules, attr_name)
                 module_path_str = f"client.api.services.{attr_name}"
-                _repr_str += f"\n{module_path_str}\n\n"
+                _repr_parts.append(f"\n{module_path_str}\n\n")
                 if hasattr(module_or_func, "_modules"):
                     for func_name in module_or_func._modules:
                         func = getattr(module_or_func, func_name)
                         sig = getattr(
                             func, "__ipython_inspector_signature_override__", ""
                         )
-                        _repr_str += f"{module_path_str}.{func_name}{sig}\n\n"
-        return _repr_str
+                        _repr_parts.append(f"{module_path_str}.{func_name}{sig}\n\n")
+        return "".join(_repr_parts)
 
 
 # code from here:
@@ -1242,6 +1423,9 @@ def _render_signature(obj_signature: Signature, obj_name: str) -> str:
     return rendered
 
 
+_MISSING = object()
+
+
 def _getdef(self: Any, obj: Any, oname: str = "") -> str | None:
     """Return the call signature for any callable object.
     If any exception is generated, None is returned instead and the
@@ -1254,10 +1438,14 @@ def _getdef(self: Any, obj: Any, oname: str = "") -> str | None:
 
 def monkey_patch_getdef(self: Any, obj: Any, oname: str = "") -> str | None:
     try:
-        if hasattr(obj, "__ipython_inspector_signature_override__"):
-            return _render_signature(
-                obj.__ipython_inspector_signature_override__, oname
-            )
+        # a single lookup, hasattr + getattr would evaluate the property on
+        # RemoteFunction twice. Lib functions set the override on the function
+        # object itself, so this can't be a lookup on type(obj)
+        signature_override = getattr(
+            obj, "__ipython_inspector_signature_override__", _MISSING
+        )
+        if signature_override is not _MISSING:
+            return _render_signature(signature_override, oname)
         return _getdef(self, obj, oname)
     except Exception:
         return None
@@ -1287,7 +1475,8 @@ class ServerIdentity(Identity):
                 "{api}'s connection is None. Can't get the server identity"
             )
         server_metadata = api.connection.get_server_metadata(api.signing_key)
-        return ServerIdentity(
+        # all values are already typed, skip pydantic validation
+        return ServerIdentity.model_construct(
             server_name=server_metadata.name,
             server_id=api.server_uid,
             verify_key=SyftVerifyKey.from_string(server_metadata.verify_key),
@@ -1297,7 +1486,7 @@ class ServerIdentity(Identity):
     def from_change_context(cls, context: ChangeContext) -> ServerIdentity:
         if context.server is None:
             raise ValueError(f"{context}'s server is None")
-        return cls(
+        return cls.model_construct(
             server_name=context.server.name,
             server_id=context.server.id,
             verify_key=context.server.signing_key.verify_key,
@@ -1305,7 +1494,7 @@ class ServerIdentity(Identity):
 
     @classmethod
     def from_server(cls, server: Server) -> ServerIdentity:
-        return cls(
+        return cls.model_construct(
             server_name=server.name,
             server_id=server.id,
             verify_key=server.signing_key.verify_key,
@@ -1314,10 +1503,11 @@ class ServerIdentity(Identity):
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, ServerIdentity):
             return False
-        return (
-            self.server_name == other.server_name
-            and self.verify_key == other.verify_key
-            and self.server_id == other.server_id
+        # tuple comparison checks identity first, so shared key objects skip __eq__
+        return (self.server_name, self.verify_key, self.server_id) == (
+            other.server_name,
+            other.verify_key,
+            other.server_id,
         )
 
     def __hash__(self) -> int:
@@ -1327,17 +1517,89 @@ class ServerIdentity(Identity):
         return f"ServerIdentity <name={self.server_name}, id={self.server_id.short()}, 🔑={str(self.verify_key)[0:8]}>"
 
 
+@dataclass
+class _ValidatorPlan:
+    """Parameter metadata of a signature, precomputed for argument validation"""
+
+    param_names: tuple[str, ...]
+    param_name_set: frozenset[str]
+    # (name, resolved annotation) of every parameter, in signature order
+    positional_plan: tuple[tuple[str, Any], ...]
+    # annotations by name, with string annotations already resolved where possible
+    resolved_annotations: dict[str, Any]
+    has_var_args: bool
+    has_var_kwargs: bool
+    # False when no parameter is annotated, values then don't need checking
+    has_typed_parameters: bool
+
+
+_UNKNOWN_PARAMETER = object()
+
+# Signatures are kept alive in their cache entry, so their ids can't be reused
+_MAX_VALIDATOR_PLANS = 4096
+_validator_plan_cache: dict[int, tuple[Signature, _ValidatorPlan]] = {}
+
+
+def _get_validator_plan(signature: Signature) -> _ValidatorPlan:
+    cached = _validator_plan_cache.get(id(signature))
+    if cached is not None and cached[0] is signature:
+        return cached[1]
+
+    parameters = signature.parameters
+    resolved_annotations = {
+        name: _resolve_annotation(param.annotation)
+        for name, param in parameters.items()
+    }
+    positional_plan = tuple(resolved_annotations.items())
+    plan = _ValidatorPlan(
+        param_names=tuple(parameters),
+        param_name_set=frozenset(parameters),
+        positional_plan=positional_plan,
+        resolved_annotations=resolved_annotations,
+        has_var_args="args" in parameters,
+        has_var_kwargs="kwargs" in parameters,
+        has_typed_parameters=any(
+            annotation is not inspect.Parameter.empty
+            for _, annotation in positional_plan
+        ),
+    )
+    if len(_validator_plan_cache) >= _MAX_VALIDATOR_PLANS:
+        _validator_plan_cache.clear()
+    _validator_plan_cache[id(signature)] = (signature, plan)
+    return plan
+
+
+def _resolve_annotation(annotation: Any) -> Any:
+    if not isinstance(annotation, str):
+        return annotation
+    # 🟡 TODO 21: make this work for weird string type situations
+    # happens when from __future__ import annotations in a class file
+    try:
+        return index_syft_by_module_name(annotation)
+    except Exception:
+        # left unresolved, passing a value for it raises as before
+        return annotation
+
+
 @as_result(SyftException)
 def validate_callable_args_and_kwargs(
     args: list, kwargs: dict, signature: Signature
 ) -> tuple[list, dict]:
-    _valid_kwargs = {}
-    if "kwargs" in signature.parameters:
-        _valid_kwargs = kwargs
-    else:
+    plan = _get_validator_plan(signature)
+    if plan.has_var_args and plan.has_var_kwargs:
+        return args, kwargs
+
+    # kwargs are only checked, callers always pass a fresh dict built from
+    # **kwargs, so it is returned as is instead of being copied over.
+    # Without annotations, only unknown kwargs need the loop (to raise)
+    if not plan.has_var_kwargs and (
+        plan.has_typed_parameters or not kwargs.keys() <= plan.param_name_set
+    ):
         for key, value in kwargs.items():
-            if key not in signature.parameters:
-                valid_parameters = list(signature.parameters)
+            # a single lookup both checks the name and gets its annotation
+            t = plan.resolved_annotations.get(key, _UNKNOWN_PARAMETER)
+            if t is _UNKNOWN_PARAMETER:
+                valid_parameters = list(plan.param_names)
                 valid_parameters_msg = (
                     f"Valid parameter: {valid_parameters}"
                     if len(valid_parameters) == 1
@@ -1351,66 +1613,54 @@ def validate_callable_args_and_kwargs(
                         f"{_signature_error_message(_format_signature(signature))}"
                     )
                 )
-            param = signature.parameters[key]
-            if isinstance(param.annotation, str):
-                # 🟡 TODO 21: make this work for weird string type situations
-                # happens when from __future__ import annotations in a class file
-                t = index_syft_by_module_name(param.annotation)
-            else:
-                t = param.annotation
-
-            if t is not inspect.Parameter.empty:
-                try:
-                    _check_type(value, t)
-                except ValueError:
-                    # TODO: fix this properly
-                    if not (t == type(Any)):
-                        _type_str = getattr(t, "__name__", str(t))
-                        raise SyftException(
-                            public_message=f"`{key}` must be of type `{_type_str}` not `{type(value).__name__}`"
-                            f"{_signature_error_message(_format_signature(signature))}"
-                        )
+            if t is inspect.Parameter.empty:
+                continue
+            if isinstance(t, str):
+                t = index_syft_by_module_name(t)
 
-            _valid_kwargs[key] = value
+            # TODO: fix this properly
+            if not _type_matches(value, t) and not (t == type(Any)):
+                _type_str = getattr(t, "__name__", str(t))
+                raise SyftException(
+                    public_message=f"`{key}` must be of type `{_type_str}` not `{type(value).__name__}`"
+                    f"{_signature_error_message(_format_signature(signature))}"
+                )
 
-    # signature.parameters is an OrderedDict, therefore,
+    # plan.positional_plan follows the order of signature.parameters, therefore,
     # its fair to assume that order of args
-    # and the signature.parameters should always match
+    # and the plan.positional_plan should always match
     _valid_args = []
-    if "args" in signature.parameters:
+    if plan.has_var_args:
         _valid_args = args
+    elif not plan.has_typed_parameters:
+        _valid_args = [
+            arg
+            for (param_key, _), arg in zip(plan.positional_plan, args)
+            if param_key not in kwargs
+        ]
     else:
-        for (param_key, param), arg in zip(signature.parameters.items(), args):
-            if param_key in _valid_kwargs:
+        for (param_key, t), arg in zip(plan.positional_plan, args):
+            if kwargs and param_key in kwargs:
                 continue
-            t = param.annotation
-            msg = None
-            try:
-                if t is not inspect.Parameter.empty:
-                    _check_type(arg, t)
-            except ValueError:
+            if t is not inspect.Parameter.empty and not _type_matches(arg, t):
                 t_arg = type(arg)
-                if (
+                # ignore error when autoreload_enabled()
+                if not (
                     autoreload_enabled()
                     and t.__module__ == t_arg.__module__
                     and t.__name__ == t_arg.__name__
                 ):
-                    # ignore error when autoreload_enabled()
-                    pass
-                else:
                     _type_str = getattr(t, "__name__", str(t))
-
-                    msg = (
-                        f"Arg is `{arg}`. \nIt must be of type `{_type_str}`, not `{type(arg).__name__}`\n"
-                        f"{_signature_error_message(_format_signature(signature))}"
+                    raise SyftException(
+                        public_message=(
+                            f"Arg is `{arg}`. \nIt must be of type `{_type_str}`, not `{type(arg).__name__}`\n"
+                            f"{_signature_error_message(_format_signature(signature))}"
+                        )
                     )
 
-            if msg:
-                raise SyftException(public_message=msg)
-
             _valid_args.append(arg)
 
-    return _valid_args, _valid_kwargs
+    return _valid_args, kwargs
 
 
 RemoteFunction.model_rebuild(force=True)
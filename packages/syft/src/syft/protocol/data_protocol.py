@@ -103,6 +103,7 @@ class DataProtocol:
     def __init__(self, filename: str, raise_exception: bool = False) -> None:
         self.file_path = data_protocol_dir() / filename
         self.raise_exception = raise_exception
+        self._latest_version_cache: tuple[tuple, PROTOCOL_TYPE] | None = None
         self.load_state()
 
     def load_state(self) -> None:
@@ -166,10 +167,21 @@ class DataProtocol:
 
     @property
     def latest_version(self) -> PROTOCOL_TYPE:
-        sorted_versions = sorted(self.protocol_history.keys(), key=natural_key)
+        # looked up on every api call, so only re-sort when the versions change
+        versions = tuple(self.protocol_history.keys())
+        if (
+            self._latest_version_cache is not None
+            and self._latest_version_cache[0] == versions
+        ):
+            return self._latest_version_cache[1]
+
+        sorted_versions = sorted(versions, key=natural_key)
         if len(sorted_versions) > 0:
-            return sorted_versions[-1] if self.has_dev else int(sorted_versions[-1])
-        return "dev"
+            latest = sorted_versions[-1] if self.has_dev else int(sorted_versions[-1])
+        else:
+            latest = "dev"
+        self._latest_version_cache = (versions, latest)
+        return latest
 
     @staticmethod
     def _hash_to_sha256(obj_dict: dict) -> str:
@@ -595,6 +607,26 @@ def debox_arg_and_migrate(arg: Any, protocol_state: dict) -> Any:
     return wrapped_arg
 
 
+def _migration_protocol_state(
+    to_protocol: PROTOCOL_TYPE | None, to_latest_protocol: bool
+) -> dict | None:
+    """Protocol state to migrate to, or None if no migration is needed."""
+    if to_protocol is None:
+        if not to_latest_protocol:
+            raise SyftException("Protocol version missing.")
+        # migrating to the latest protocol is always a no-op
+        return None
+
+    data_protocol = get_data_protocol()
+
+    # If latest protocol being used is equal to the protocol to be migrate
+    # then skip migration of the object
+    if to_protocol == data_protocol.latest_version:
+        return None
+
+    return data_protocol.build_state(stop_key=str(to_protocol))
+
+
 def migrate_args_and_kwargs(
     args: tuple,
     kwargs: dict,
@@ -606,21 +638,10 @@ def migrate_args_and_kwargs(
     If `to_protocol` is None, then migrate to latest protocol version.
 
     """
-    data_protocol = get_data_protocol()
-
-    if to_protocol is None:
-        to_protocol = data_protocol.latest_version if to_latest_protocol else None
-
-    if to_protocol is None:
-        raise SyftException("Protocol version missing.")
-
-    # If latest protocol being used is equal to the protocol to be migrate
-    # then skip migration of the object
-    if to_protocol == data_protocol.latest_version:
+    protocol_state = _migration_protocol_state(to_protocol, to_latest_protocol)
+    if protocol_state is None:
         return args, kwargs
 
-    protocol_state = data_protocol.build_state(stop_key=str(to_protocol))
-
     migrated_kwargs, migrated_args = {}, []
 
     for param_name, param_val in kwargs.items():
@@ -638,3 +659,19 @@ def migrate_args_and_kwargs(
         migrated_args.append(migrated_val)
 
     return tuple(migrated_args), migrated_kwargs
+
+
+def migrate_result(
+    result: Any,
+    to_protocol: PROTOCOL_TYPE | None = None,
+    to_latest_protocol: bool = False,
+) -> Any:
+    """Migrate a single value, e.g. an api call result, to the given protocol.
+
+    Same as `migrate_args_and_kwargs` without packing the value into args.
+    """
+    protocol_state = _migration_protocol_state(to_protocol, to_latest_protocol)
+    if protocol_state is None:
+        return result
+
+    return debox_arg_and_migrate(arg=result, protocol_state=protocol_state)
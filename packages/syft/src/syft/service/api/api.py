@@ -1,6 +1,7 @@
 # stdlib
 import ast
 from collections.abc import Callable
+from functools import lru_cache
 import inspect
 from inspect import Signature
 import keyword
@@ -8,6 +9,7 @@ import linecache
 import re
 import textwrap
 from textwrap import dedent
+from types import CodeType
 from typing import Any
 from typing import cast
 
@@ -91,6 +93,16 @@ def register_fn_in_linecache(fname: str, src: str) -> None:
     linecache.cache[fname] = (137, None, lines, fname)
 
 
+@lru_cache(maxsize=256)
+def compile_endpoint_function(api_code: str, fname: str) -> tuple[str, CodeType]:
+    """strips the decorators from an endpoint function and compiles it under fname.
+    Endpoints are loaded from the stash on every call, so this is cached on the source"""
+    inner_function = ast.parse(api_code).body[0]
+    inner_function.decorator_list = []
+    src = ast.unparse(inner_function)
+    return src, compile(src, fname, "exec")
+
+
 @serializable()
 class TwinAPIEndpointViewV1(SyftObject):
     # version
@@ -277,19 +289,17 @@ class Endpoint(SyftObject):
     def call_locally(
         self, context: AuthedServiceContext, *args: Any, **kwargs: Any
     ) -> Any:
-        inner_function = ast.parse(self.api_code).body[0]
-        inner_function.decorator_list = []
         # compile the function
-        raw_byte_code = compile(ast.unparse(inner_function), "<string>", "exec")
+        _, raw_byte_code = compile_endpoint_function(self.api_code, "<string>")
 
         # load it
-        exec(raw_byte_code)  # nosec
+        _locals: dict[str, Any] = {}
+        exec(raw_byte_code, globals(), _locals)  # nosec
 
         internal_context = self.build_internal_context(context=context)
 
         # execute it
-        evil_string = f"{self.func_name}(*args, **kwargs,context=internal_context)"
-        result = eval(evil_string, None, locals())  # nosec
+        result = _locals[self.func_name](*args, **kwargs, context=internal_context)
 
         # Update code context state
         self.update_state(internal_context.state)
@@ -608,11 +618,10 @@ class TwinAPIEndpoint(SyncableSyftObject):
             else:
                 print = original_print  # type: ignore
 
-            inner_function = ast.parse(code.api_code).body[0]
-            inner_function.decorator_list = []
             # compile the function
-            src = ast.unparse(inner_function)
-            raw_byte_code = compile(src, code.func_name, "exec")
+            src, raw_byte_code = compile_endpoint_function(
+                code.api_code, code.func_name
+            )
             register_fn_in_linecache(code.func_name, src)
             user_client = self.get_user_client_from_server(context)
             admin_client = self.get_admin_client_from_server(context)
@@ -620,18 +629,19 @@ class TwinAPIEndpoint(SyncableSyftObject):
             internal_context = code.build_internal_context(
                 context=context, admin_client=admin_client, user_client=user_client
             )
-            evil_string = f"{code.func_name}(*args, **kwargs,context=internal_context)"
 
             _globals = {"print": print}
+            _locals: dict[str, Any] = {}
             # load it
-            exec(raw_byte_code, _globals, locals())  # nosec
+            exec(raw_byte_code, _globals, _locals)  # nosec
 
             # execute it
-            evil_string = f"{code.func_name}(*args, **kwargs,context=internal_context)"
             result = None
             try:
                 # users can raise SyftException in their code
-                result = eval(evil_string, _globals, locals())  # nosec
+                result = _locals[code.func_name](
+                    *args, **kwargs, context=internal_context
+                )
             except SyftException as e:
                 # capture it as the result variable
                 result = e
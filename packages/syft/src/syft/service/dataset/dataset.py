@@ -11,6 +11,7 @@ from IPython.display import display
 import markdown
 import pandas as pd
 from pydantic import ConfigDict
+from pydantic import Field
 from pydantic import field_validator
 from pydantic import model_validator
 from typing_extensions import Self
@@ -95,7 +96,7 @@ class Asset(SyftObject):
     data_subjects: list[DataSubject] = []
     mock_is_real: bool = False
     shape: tuple | None = None
-    created_at: DateTime = DateTime.now()
+    created_at: DateTime = Field(default_factory=DateTime.now)
     uploader: Contributor | None = None
 
     # _kwarg_name and _dataset_name are set by the UserCode.assets
@@ -185,15 +186,19 @@ class Asset(SyftObject):
         return f"Asset(name='{self.name}', server_uid='{self.server_uid}', action_id='{self.action_id}')"
 
     def _repr_markdown_(self, wrap_as_python: bool = True, indent: int = 0) -> str:
-        _repr_str = f"Asset: {self.name}\n"
-        _repr_str += f"Pointer Id: {self.action_id}\n"
-        _repr_str += f"Description: {self.description}\n"
-        _repr_str += f"Total Data Subjects: {len(self.data_subjects)}\n"
-        _repr_str += f"Shape: {self.shape}\n"
-        _repr_str += f"Contributors: {len(self.contributors)}\n"
-        for contributor in self.contributors:
-            _repr_str += f"\t{contributor.name}: {contributor.email}\n"
-        return as_markdown_python_code(_repr_str)
+        parts = [
+            f"Asset: {self.name}\n",
+            f"Pointer Id: {self.action_id}\n",
+            f"Description: {self.description}\n",
+            f"Total Data Subjects: {len(self.data_subjects)}\n",
+            f"Shape: {self.shape}\n",
+            f"Contributors: {len(self.contributors)}\n",
+        ]
+        parts.extend(
+            f"\t{contributor.name}: {contributor.email}\n"
+            for contributor in sorted(self.contributors, key=lambda c: c.email)
+        )
+        return as_markdown_python_code("".join(parts))
 
     def _coll_repr_(self) -> dict[str, Any]:
         base_dict = {
@@ -280,11 +285,8 @@ class Asset(SyftObject):
         api = self.get_api_wrapped()
         if api.is_err():
             return None
-        res = api.unwrap().services.action.get(self.action_id)
-        if self.has_permission(res):
-            return res.syft_action_data
-        else:
-            raise SyftException(public_message="You have no access to the private data")
+        # a denied action.get raises SyftException, which as_result turns into Err
+        return api.unwrap().services.action.get(self.action_id).syft_action_data
 
     @property
     def data(self) -> Any:
@@ -457,7 +459,7 @@ class Dataset(SyftObject):
     updated_at: str | None = None
     requests: int | None = 0
     mb_size: float | None = None
-    created_at: DateTime = DateTime.now()
+    created_at: DateTime = Field(default_factory=DateTime.now)
     uploader: Contributor
     summary: str | None = None
     to_be_deleted: bool = False
@@ -541,23 +543,22 @@ class Dataset(SyftObject):
         return DictTuple((asset.name, asset) for asset in self.asset_list)
 
     def _repr_markdown_(self, wrap_as_python: bool = True, indent: int = 0) -> str:
-        _repr_str = f"Syft Dataset: {self.name}\n\n"
-        _repr_str += "Assets:\n\n"
+        parts = [f"Syft Dataset: {self.name}\n\n", "Assets:\n\n"]
         for asset in self.asset_list:
             if asset.description is not None:
                 description_text = textwrap.shorten(
                     asset.description.text, width=100, placeholder="..."
                 )
-                _repr_str += f"\t{asset.name}: {description_text}\n\n"
+                parts.append(f"\t{asset.name}: {description_text}\n\n")
             else:
-                _repr_str += f"\t{asset.name}\n\n"
+                parts.append(f"\t{asset.name}\n\n")
         if self.citation:
-            _repr_str += f"Citation: {self.citation}\n\n"
+            parts.append(f"Citation: {self.citation}\n\n")
         if self.url:
-            _repr_str += f"URL: {self.url}\n\n"
+            parts.append(f"URL: {self.url}\n\n")
         if self.description:
-            _repr_str += f"Description: \n\n{self.description.text}\n\n"
-        return _repr_str
+            parts.append(f"Description: \n\n{self.description.text}\n\n")
+        return "".join(parts)
 
     @property
     def client(self) -> Any | None:
@@ -710,18 +711,14 @@ class CreateDataset(Dataset):
         return self.add_asset(asset=asset, force_replace=True)
 
     def remove_asset(self, name: str) -> SyftSuccess:
-        asset_to_remove = None
-        for asset in self.asset_list:
+        for i, asset in enumerate(self.asset_list):
             if asset.name == name:
-                asset_to_remove = asset
-                break
+                del self.asset_list[i]
+                return SyftSuccess(
+                    message=f"Asset '{name}' removed from '{self.name}' Dataset."
+                )
 
-        if asset_to_remove is None:
-            raise SyftException(public_message=f"No asset exists with name: {name}")
-        self.asset_list.remove(asset_to_remove)
-        return SyftSuccess(
-            message=f"Asset '{self.name}' removed from '{self.name}' Dataset."
-        )
+        raise SyftException(public_message=f"No asset exists with name: {name}")
 
     def check(self) -> SyftSuccess:
         errors = []
@@ -836,11 +833,12 @@ def convert_asset(context: TransformContext) -> TransformContext:
     if context.output is None:
         return context
 
+    # the transform builds each asset's own TransformContext from this one's
+    # server and credentials, so there is nothing to prepare per asset here
     assets = context.output.pop("asset_list", [])
-    for idx, create_asset in enumerate(assets):
-        asset_context = TransformContext.from_context(obj=create_asset, context=context)
-        assets[idx] = create_asset.to(Asset, context=asset_context)
-    context.output["asset_list"] = assets
+    context.output["asset_list"] = [
+        create_asset.to(Asset, context=context) for create_asset in assets
+    ]
 
     return context
 
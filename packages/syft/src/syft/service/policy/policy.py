@@ -184,7 +184,7 @@ def partition_by_server(kwargs: dict[str, Any]) -> dict[ServerIdentity, dict[str
             raise Exception(f"Input {k} must have a UID not {type(v)}")
 
         _obj_exists = False
-        for identity, api in APIRegistry.__api_registry__.items():
+        for api in APIRegistry.get_all_api():
             try:
                 if api.services.action.exists(uid):
                     server_identity = ServerIdentity.from_api(api)
@@ -200,7 +200,7 @@ def partition_by_server(kwargs: dict[str, Any]) -> dict[ServerIdentity, dict[str
                 # in APIRegistry
                 continue
             except Exception as e:
-                print(f"Error in partition_by_server with identity {identity}", e)
+                print(f"Error in partition_by_server with server {api.server_uid}", e)
                 raise e
 
         if not _obj_exists:
@@ -1,7 +1,9 @@
 # stdlib
 from copy import deepcopy
+import logging
 import traceback
 from typing import Any
+from typing import ClassVar
 from typing import TYPE_CHECKING
 
 # third party
@@ -16,12 +18,30 @@ if TYPE_CHECKING:
     # relative
     from .context import AuthedServiceContext
 
+logger = logging.getLogger(__name__)
+
+# missing attributes resolved the normal way instead of raising the
+# "You have tried accessing ..." error, e.g. IPython display probes
+_PASSTHROUGH_ATTRS = frozenset(
+    {
+        "_sanitized_message",
+        "_ipython_canary_method_should_not_exist_",
+        "_ipython_display_",
+        "__canonical_name__",
+        "__version__",
+    }
+)
+
 
 class SyftResponseMessage(SyftBaseModel):
     message: str
-    _bool: bool = True
+    _bool: ClassVar[bool] = True
     require_api_update: bool = False
     client_warnings: list[str] = []
+    _repr_html_class_: ClassVar[str] = "alert-info"
+
+    # (message, sanitized message) from the last HTML render
+    _sanitized_message: tuple[str, str] | None = None
 
     def add_warnings_from_context(self, context: "AuthedServiceContext") -> None:
         self.client_warnings = deepcopy(context.client_warnings)
@@ -33,22 +53,7 @@ class SyftResponseMessage(SyftBaseModel):
         return True
 
     def __getattr__(self, name: str) -> Any:
-        if name in [
-            "_bool",
-            # "_repr_html_",
-            # "message",
-            # 'require_api_update',
-            # '__bool__',
-            # '__eq__',
-            # '__repr__',
-            # '__str__',
-            # '_repr_html_class_',
-            # '_repr_html_',
-            "_ipython_canary_method_should_not_exist_",
-            "_ipython_display_",
-            "__canonical_name__",
-            "__version__",
-        ] or name.startswith("_repr"):
+        if name.startswith("_repr") or name in _PASSTHROUGH_ATTRS:
             return super().__getattr__(name)
         raise AttributeError(
             f"You have tried accessing `{name}` on a {type(self).__name__} with message: {self.message}"
@@ -73,27 +78,29 @@ class SyftResponseMessage(SyftBaseModel):
     def __str__(self) -> str:
         return self.__repr__()
 
-    @property
-    def _repr_html_class_(self) -> str:
-        return "alert-info"
+    def _sanitized_message_html(self) -> str:
+        # notebooks re-render the same response many times, only sanitize once per message
+        cached = self._sanitized_message
+        if cached is None or cached[0] is not self.message:
+            cached = (self.message, sanitize_html(self.message))
+            self._sanitized_message = cached
+        return cached[1]
 
     def _repr_html_(self) -> str:
+        html_class = self._repr_html_class_
         return (
-            f'<div class="{self._repr_html_class_}">'
+            f'<div class="{html_class}">'
             f"<strong>{type(self).__name__}</strong>: "
-            f'<pre class="{self._repr_html_class_}">'
-            f"{sanitize_html(self.message)}</pre></div><br/>"
+            f'<pre class="{html_class}">'
+            f"{self._sanitized_message_html()}</pre></div><br/>"
         )
 
 
 @serializable(canonical_name="SyftError", version=1)
 class SyftError(SyftResponseMessage):
-    _bool: bool = False
+    _bool: ClassVar[bool] = False
     tb: str | None = None
-
-    @property
-    def _repr_html_class_(self) -> str:
-        return "alert-danger"
+    _repr_html_class_: ClassVar[str] = "alert-danger"
 
     def __bool__(self) -> bool:
         return False
@@ -133,21 +140,22 @@ class SyftError(SyftResponseMessage):
                 lines = traceback.format_exception(exc)
                 tb = "".join(lines)
                 error_msg = lines[-1]
-                print(f"Error: {tb}")
+                logger.error(f"Error: {tb}")
         else:
             if isinstance(exc, NewSyftException):
                 error_msg = exc.get_message(context)
             else:
                 # by default only type
                 error_msg = f"Something unexpected happened server side {type(exc)}"
-            print(f"Error: {exc}")
-            print(traceback.format_exc())
+            # the traceback is only formatted when debug logging is enabled
+            logger.debug(f"Error: {exc}", exc_info=exc)
         return cls(message=error_msg, tb=tb)
 
 
 @serializable(canonical_name="SyftSuccess", version=1)
 class SyftSuccess(SyftResponseMessage):
     value: Any | None = None
+    _repr_html_class_: ClassVar[str] = "alert-success"
 
     def is_err(self) -> bool:
         return False
@@ -155,34 +163,22 @@ class SyftSuccess(SyftResponseMessage):
     def is_ok(self) -> bool:
         return True
 
-    @property
-    def _repr_html_class_(self) -> str:
-        return "alert-success"
-
     def unwrap_value(self) -> Any:
         return self.value
 
 
 @serializable(canonical_name="SyftNotReady", version=1)
 class SyftNotReady(SyftError):
-    _bool: bool = False
-
-    @property
-    def _repr_html_class_(self) -> str:
-        return "alert-info"
+    _bool: ClassVar[bool] = False
+    _repr_html_class_: ClassVar[str] = "alert-info"
 
 
 @serializable(canonical_name="SyftWarning", version=1)
 class SyftWarning(SyftResponseMessage):
-    @property
-    def _repr_html_class_(self) -> str:
-        return "alert-warning"
+    _repr_html_class_: ClassVar[str] = "alert-warning"
 
 
 @serializable(canonical_name="SyftInfo", version=1)
 class SyftInfo(SyftResponseMessage):
-    _bool: bool = False
-
-    @property
-    def _repr_html_class_(self) -> str:
-        return "alert-info"
+    _bool: ClassVar[bool] = False
+    _repr_html_class_: ClassVar[str] = "alert-info"
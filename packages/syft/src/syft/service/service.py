@@ -26,6 +26,7 @@ from typing_extensions import Self
 # relative
 from ..abstract_server import AbstractServer
 from ..protocol.data_protocol import migrate_args_and_kwargs
+from ..protocol.data_protocol import migrate_result
 from ..serde.lib_permissions import CMPCRUDPermission
 from ..serde.lib_permissions import CMPPermission
 from ..serde.lib_service_registry import CMPBase
@@ -489,12 +490,7 @@ def service_method(
                 )
             result = func(self, *args, **kwargs)
             if communication_protocol:
-                result, _ = migrate_args_and_kwargs(
-                    args=(result,),
-                    kwargs={},
-                    to_protocol=communication_protocol,
-                )
-                result = result[0]
+                result = migrate_result(result, to_protocol=communication_protocol)
             context = kwargs.get("context", None)
             context = args[0] if context is None else context
             attrs_to_attach = {
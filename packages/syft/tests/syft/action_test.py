@@ -77,6 +77,12 @@ def test_call_lib_function_action2(worker):
     assert root_datasite_client.api.lib.numpy.add(1, 2) == 3
 
 
+def test_call_lib_function_kwargs(worker):
+    root_datasite_client = worker.root_client
+    res = root_datasite_client.api.lib.numpy.sum([1, 2, 3], axis=0)
+    assert res.syft_action_data == 6
+
+
 def test_lib_class_init_action(worker):
     root_datasite_client = worker.root_client
     numpy_client = root_datasite_client.api.lib.numpy
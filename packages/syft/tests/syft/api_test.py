@@ -1,13 +1,35 @@
 # stdlib
+from collections import defaultdict
 from collections.abc import Callable
+from inspect import signature
+from typing import Any
 
 # third party
 import numpy as np
+import pytest
 
 # syft absolute
 import syft as sy
+from syft.client.api import APIRegistry
+from syft.client.api import LibEndpoint
+from syft.client.api import ServerIdentity
+from syft.client.api import SyftAPICall
+from syft.client.api import _get_isinstance_types
+from syft.client.api import _get_validator_plan
+from syft.client.api import _signature_needs_downgrade
+from syft.client.api import _type_adapter_cache
+from syft.client.api import _type_matches
+from syft.client.api import downgrade_signature
+from syft.client.api import monkey_patch_getdef
+from syft.client.api import unwrap_and_migrate_annotation
+from syft.client.api import validate_callable_args_and_kwargs
+from syft.serde.deserialize import _deserialize
+from syft.serde.serialize import _serialize
+from syft.server.credentials import SyftSigningKey
 from syft.service.response import SyftError
 from syft.service.user.user_roles import ServiceRole
+from syft.types.errors import SyftException
+from syft.types.uid import UID
 
 
 def test_api_cache_invalidation(worker):
@@ -70,3 +92,250 @@ def test_api_cache_invalidation_login(root_verify_key, worker):
     guest_client = guest_client.login(email="a@b.org", password="aaa")
 
     assert guest_client.upload_dataset(dataset)
+
+
+def test_downgrade_signature_is_memoized_per_protocol():
+    def func(uid: UID, uids: dict[str, list[UID]]) -> UID:
+        pass
+
+    sig = signature(func)
+    object_versions: dict = {}
+
+    downgraded = downgrade_signature(sig, object_versions)
+    assert downgraded == sig
+    assert downgrade_signature(sig, object_versions) is downgraded
+    assert downgrade_signature(sig, {}) is not downgraded
+    assert unwrap_and_migrate_annotation(list[UID], object_versions) == list[UID]
+
+
+def test_unwrap_and_migrate_pep604_union():
+    assert unwrap_and_migrate_annotation(UID | None, {}) == UID | None
+    assert (
+        unwrap_and_migrate_annotation(list[UID] | str | None, {})
+        == list[UID] | str | None
+    )
+
+
+def test_api_registry_get_by_recent_server_uid(monkeypatch):
+    # the placeholder apis must not leak into the global registry
+    monkeypatch.setattr(APIRegistry, "__api_registry__", {})
+    monkeypatch.setattr(APIRegistry, "__api_registry_by_server__", defaultdict(list))
+
+    server_uid = UID()
+    first_key = SyftSigningKey.generate().verify_key
+    second_key = SyftSigningKey.generate().verify_key
+    first_api, second_api, replaced_api = object(), object(), object()
+
+    assert APIRegistry.get_by_recent_server_uid(server_uid) is None
+    assert APIRegistry.get_by_recent_server_uid(None) is None
+
+    APIRegistry.set_api_for(server_uid, first_key, first_api)
+    APIRegistry.set_api_for(server_uid, second_key, second_api)
+    APIRegistry.set_api_for(UID(), first_key, object())
+    assert APIRegistry.get_by_recent_server_uid(server_uid) is second_api
+
+    # replacing an api keeps its registration order
+    APIRegistry.set_api_for(server_uid, first_key, replaced_api)
+    assert APIRegistry.get_by_recent_server_uid(server_uid) is second_api
+    assert APIRegistry.api_for(server_uid, first_key).unwrap() is replaced_api
+
+
+def test_api_lib_without_lib_endpoints_keeps_services(worker):
+    api = worker.root_client.api
+    services = api.services
+
+    api.lib_endpoints = None
+    api.libs = None
+    assert api.lib is None
+    assert api.services is services
+
+
+def test_api_repr(worker):
+    api = worker.root_client.api
+    api_repr = repr(api)
+
+    assert api_repr.startswith("client.api.services\n")
+    assert "\nclient.api.services.user\n\n" in api_repr
+    assert "client.api.services.user.get_all(" in api_repr
+    assert repr(api) == api_repr
+
+
+@pytest.mark.parametrize(
+    "server_protocol, communication_protocol, needs_downgrade",
+    [
+        ("dev", "dev", False),
+        ("dev", "2", True),
+        ("3", 3, False),
+        ("3", "2", True),
+        ("2", "3", False),
+    ],
+)
+def test_signature_needs_downgrade(
+    server_protocol, communication_protocol, needs_downgrade
+):
+    assert (
+        _signature_needs_downgrade(server_protocol, communication_protocol)
+        is needs_downgrade
+    )
+
+
+def test_endpoint_display_signature_is_cached():
+    def func(self, context, uid: UID) -> UID:
+        pass
+
+    endpoint_kwargs = {
+        "service_path": "action.execute",
+        "module_path": "test.func",
+        "name": "func",
+        "description": "",
+        "signature": signature(func),
+    }
+    endpoint = LibEndpoint(**endpoint_kwargs)
+
+    display_signature = endpoint.display_signature
+    assert list(display_signature.parameters) == ["uid"]
+    assert endpoint.display_signature is display_signature
+    # displaying an endpoint doesn't change how it compares
+    assert endpoint == LibEndpoint(**endpoint_kwargs)
+
+
+def test_signed_api_call_message_is_deserialized_once():
+    api_call = SyftAPICall(server_uid=UID(), path="test.path", args=[1], kwargs={})
+    signed_call = _deserialize(
+        _serialize(api_call.sign(SyftSigningKey.generate()), to_bytes=True),
+        from_bytes=True,
+    )
+
+    message = signed_call.message
+    assert message.path == "test.path"
+    assert signed_call.message is message
+
+
+def test_type_matches_reuses_type_adapter() -> None:
+    assert _type_matches([UID()], list[UID])
+    type_adapter = _type_adapter_cache[list[UID]]
+
+    assert _type_matches([UID()], list[UID])
+    assert _type_adapter_cache[list[UID]] is type_adapter
+    assert not _type_matches(["not a uid"], list[UID])
+
+
+@pytest.mark.parametrize(
+    "annotation,expected",
+    [
+        (UID, UID),
+        (UID | None, (UID, type(None))),
+        (Any, object),
+        (list[UID], None),
+        (list[UID] | None, None),
+    ],
+)
+def test_type_matches_isinstance_fast_path(annotation: Any, expected: Any) -> None:
+    assert _get_isinstance_types(annotation) == expected
+
+
+def test_type_matches_falls_back_to_coercion() -> None:
+    # not an instance of float, but accepted by pydantic
+    assert _type_matches(1, float)
+    assert not _type_matches("not a uid", UID | None)
+
+
+def test_validator_plan_is_cached_per_signature():
+    def func(uid: UID, name: str = "") -> None:
+        pass
+
+    sig = signature(func)
+    plan = _get_validator_plan(sig)
+    assert plan.param_names == ("uid", "name")
+    assert not plan.has_var_args and not plan.has_var_kwargs
+    assert _get_validator_plan(sig) is plan
+    assert _get_validator_plan(signature(func)) is not plan
+
+    uid = UID()
+    args, kwargs = validate_callable_args_and_kwargs([uid], {"name": "a"}, sig).unwrap()
+    assert args == [uid] and kwargs == {"name": "a"}
+
+    with pytest.raises(SyftException):
+        validate_callable_args_and_kwargs([uid], {"other": 1}, sig).unwrap()
+
+
+def test_validator_plan_resolves_string_annotations():
+    def func(uid: "syft.types.uid.UID", other: "numpy.ndarray") -> None:  # noqa: F821
+        pass
+
+    plan = _get_validator_plan(signature(func))
+    assert plan.resolved_annotations == {"uid": UID, "other": "numpy.ndarray"}
+
+    uid = UID()
+    sig = signature(func)
+    _, kwargs = validate_callable_args_and_kwargs([], {"uid": uid}, sig).unwrap()
+    assert kwargs == {"uid": uid}
+    args, _ = validate_callable_args_and_kwargs([uid], {}, sig).unwrap()
+    assert args == [uid]
+
+
+def test_validate_untyped_signature():
+    def func(a, b=None):  # type: ignore
+        pass
+
+    sig = signature(func)
+    assert not _get_validator_plan(sig).has_typed_parameters
+
+    args, kwargs = validate_callable_args_and_kwargs((1,), {"b": 2}, sig).unwrap()
+    assert args == [1] and kwargs == {"b": 2}
+
+    with pytest.raises(SyftException):
+        validate_callable_args_and_kwargs((1,), {"c": 2}, sig).unwrap()
+
+
+def test_server_identity_equality():
+    verify_key = SyftSigningKey.generate().verify_key
+    identity = ServerIdentity(
+        server_name="server", server_id=UID(), verify_key=verify_key
+    )
+    other = _deserialize(_serialize(identity, to_bytes=True), from_bytes=True)
+
+    repr(identity)
+    assert other == identity
+    assert {identity: 1}[other] == 1
+
+    identity.server_name = "renamed"
+    assert identity != other
+    assert hash(identity) == hash(("renamed", verify_key))
+
+
+def test_validate_reports_wrong_argument_types():
+    def func(uid: UID, uids: list[UID]) -> None:
+        pass
+
+    sig = signature(func)
+    with pytest.raises(SyftException, match="must be of type `UID`"):
+        validate_callable_args_and_kwargs(["not a uid"], {}, sig).unwrap()
+    with pytest.raises(SyftException, match="`uids` must be of type"):
+        validate_callable_args_and_kwargs([UID()], {"uids": [1]}, sig).unwrap()
+
+
+def test_monkey_patch_getdef_uses_signature_override():
+    def func(a: int) -> None:
+        pass
+
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    wrapper.__ipython_inspector_signature_override__ = signature(func)
+    assert monkey_patch_getdef(None, wrapper, "wrapper") == "wrapper(a: int) -> None"
+    assert monkey_patch_getdef(None, func, "func") == "func(a: int) -> None"
+
+
+def test_generated_remote_functions_validate_arguments(worker):
+    view = worker.root_client.api.services.user.view
+    uid = UID()
+
+    assert validate_callable_args_and_kwargs([uid], {}, view.signature).unwrap() == (
+        [uid],
+        {},
+    )
+    with pytest.raises(SyftException, match="must be of type `UID`"):
+        validate_callable_args_and_kwargs(["not a uid"], {}, view.signature).unwrap()
+    with pytest.raises(SyftException, match="Invalid parameter: `name`"):
+        validate_callable_args_and_kwargs([], {"name": "a"}, view.signature).unwrap()
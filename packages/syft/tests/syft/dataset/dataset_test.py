@@ -0,0 +1,13 @@
+# syft absolute
+import syft as sy
+from syft.service.dataset.dataset import Dataset
+
+
+def test_dataset_equality_after_reading_assets(mock_dataset: Dataset) -> None:
+    restored = sy.deserialize(
+        sy.serialize(mock_dataset, to_bytes=True), from_bytes=True
+    )
+    assert mock_dataset == restored
+
+    assert mock_dataset.assets[0].name == "mock_asset"
+    assert mock_dataset == restored
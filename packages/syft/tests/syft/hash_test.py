@@ -56,3 +56,14 @@ def test_nested_hashing():
     )
 
     assert obj1.hash() == obj2.hash()
+
+
+def test_hashing_does_not_grow_exclude_attrs():
+    obj = MockObject(key="key", value="value")
+    exclude_attrs = list(MockObject.__hash_exclude_attrs__)
+
+    first = obj.hash()
+    for _ in range(3):
+        assert obj.hash() == first
+
+    assert MockObject.__hash_exclude_attrs__ == exclude_attrs
@@ -192,6 +192,45 @@ def test_cannot_add_assets_with_none_mock_to_dataset(
     assert _ASSET_WITH_NONE_MOCK_ERROR_MESSAGE in str(excinfo.value)
 
 
+def test_dataset_assets_view_follows_asset_list() -> None:
+    dataset = Dataset(name=random_hash())
+    first = Asset(**make_asset_with_mock())
+    dataset.add_asset(first)
+
+    assets = dataset.assets
+    assert dataset.assets is assets
+    assert assets[first.name] is first
+
+    second = Asset(**make_asset_with_mock())
+    dataset.add_asset(second)
+    assert list(dataset.assets) == [first, second]
+
+    replacement = Asset(**{**make_asset_with_mock(), "name": first.name})
+    dataset.replace_asset(replacement)
+    assert dataset.assets[first.name] is replacement
+
+    dataset.remove_asset(second.name)
+    assert list(dataset.assets) == [replacement]
+
+    replacement.name = "renamed"
+    assert dataset.assets["renamed"] is replacement
+    assert list(dataset.assets.keys()) == ["renamed"]
+
+
+def test_remove_asset_by_name(asset_with_mock: dict[str, Any]) -> None:
+    dataset = Dataset(name=random_hash())
+    asset = Asset(**asset_with_mock)
+    dataset.add_asset(asset)
+
+    res = dataset.remove_asset(asset.name)
+    assert isinstance(res, SyftSuccess)
+    assert asset.name in res.message
+    assert dataset.asset_list == []
+
+    with pytest.raises(SyftException):
+        dataset.remove_asset(asset.name)
+
+
 def test_guest_client_get_empty_mock_as_private_pointer(
     worker: Worker,
     asset_with_empty_mock: dict[str, Any],
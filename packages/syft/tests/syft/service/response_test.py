@@ -0,0 +1,91 @@
+# stdlib
+import logging
+
+# third party
+import pytest
+
+# syft absolute
+from syft.service.response import SyftError
+from syft.service.response import SyftInfo
+from syft.service.response import SyftNotReady
+from syft.service.response import SyftSuccess
+from syft.service.response import SyftWarning
+
+
+def test_response_missing_attribute_mentions_message() -> None:
+    error = SyftError(message="something broke")
+
+    with pytest.raises(AttributeError, match="something broke"):
+        error.unknown_attribute  # noqa: B018
+
+    assert not hasattr(error, "unknown_attribute")
+
+
+def test_response_passthrough_attributes() -> None:
+    success = SyftSuccess(message="done")
+
+    assert bool(success)
+    assert not hasattr(success, "_ipython_canary_method_should_not_exist_")
+    assert not hasattr(success, "_repr_latex_")
+    assert "done" in success._repr_html_()
+
+
+def test_response_html_follows_message_updates() -> None:
+    error = SyftError(message="<script>alert(1)</script>first")
+
+    html = error._repr_html_()
+    assert "first" in html
+    assert "<script>" not in html
+    assert error._repr_html_() == html
+
+    error.message = "second"
+    assert "second" in error._repr_html_()
+
+
+def test_from_exception_without_traceback(caplog: pytest.LogCaptureFixture) -> None:
+    try:
+        raise ValueError("private detail")
+    except ValueError as e:
+        with caplog.at_level(logging.DEBUG, logger="syft.service.response"):
+            error = SyftError.from_exception(context=None, exc=e)
+
+    assert error.tb is None
+    assert "private detail" not in error.message
+    assert "ValueError" in error.message
+    # only the server side debug log carries the details
+    assert "private detail" in caplog.text
+    assert "Traceback" in caplog.text
+
+
+def test_from_exception_with_traceback(caplog: pytest.LogCaptureFixture) -> None:
+    try:
+        raise ValueError("visible detail")
+    except ValueError as e:
+        with caplog.at_level(logging.ERROR, logger="syft.service.response"):
+            error = SyftError.from_exception(
+                context=None, exc=e, include_traceback=True
+            )
+
+    assert error.tb is not None
+    assert "visible detail" in error.message
+    assert error.tb in caplog.text
+
+
+@pytest.mark.parametrize(
+    "response_type, expected",
+    [
+        (SyftSuccess, True),
+        (SyftWarning, True),
+        (SyftError, False),
+        (SyftNotReady, False),
+        (SyftInfo, False),
+    ],
+)
+def test_response_truthiness(response_type: type, expected: bool) -> None:
+    response = response_type(message="msg")
+
+    assert bool(response) is expected
+    assert response == expected
+    assert response == response_type(message="msg")
+    assert response.is_ok() is not isinstance(response, SyftError)
+    assert response.is_err() is isinstance(response, SyftError)